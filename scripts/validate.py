@@ -6,19 +6,31 @@ Run from the repository root:
 
 Uses only the Python standard library (no external dependencies).
 Exit code 0 = all checks pass, 1 = one or more failures.
+
+After a passing run, the SHA-256 of each data file and of this script is
+stored in .validate-cache; later runs with identical files skip the checks.
+Pass --no-cache to always run them.
 """
 
 import csv
+import hashlib
+import io
+import json
 import re
 import sys
+from itertools import zip_longest
 from pathlib import Path
+from typing import Optional
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+SCRIPT_FILE = Path(__file__).resolve()
+DATA_DIR = SCRIPT_FILE.parent.parent / "data"
+CACHE_FILE = DATA_DIR.parent / ".validate-cache"
 
 COUNTIES_FILE = DATA_DIR / "counties.csv"
 MUNICIPALITIES_FILE = DATA_DIR / "municipalities.csv"
 MUNICIPALITY_COUNTY_FILE = DATA_DIR / "municipality_county.csv"
 POSTAL_FILE = DATA_DIR / "postal_to_municipality.csv"
+DATA_FILES = (COUNTIES_FILE, MUNICIPALITIES_FILE, MUNICIPALITY_COUNTY_FILE, POSTAL_FILE)
 
 COUNTIES_HEADER = ["county_code", "county_name", "county_name_short"]
 MUNICIPALITIES_HEADER = [
@@ -42,27 +54,133 @@ POSTAL_HEADER = [
     "municipality_name",
 ]
 
+# Column positions within each file's rows, matching the headers above.
+COUNTY_CODE_IDX = 0
+COUNTY_NAME_IDX = 1
+COUNTY_NAME_SHORT_IDX = 2
 
-failures = 0
+# municipality_county.csv shares its first four columns with municipalities.csv.
+MUNI_CODE_IDX = 0
+MUNI_NAME_IDX = 1
+MUNI_NAME_SHORT_IDX = 2
+MUNI_COUNTY_CODE_IDX = 3
+MUNI_COUNTY_NAME_IDX = 4
+MUNI_COUNTY_NAME_SHORT_IDX = 5
 
+POSTAL_CODE_IDX = 0
+POSTAL_LOCALITY_IDX = 1
+POSTAL_MUNI_CODE_IDX = 2
+POSTAL_MUNI_NAME_IDX = 3
 
-def check(label: str, ok: bool, detail: str = "") -> bool:
-    global failures
-    if ok:
-        print(f"  \u2713 {label}")
-    else:
-        msg = f"  \u2717 {label}"
-        if detail:
-            msg += f" — {detail}"
-        print(msg)
-        failures += 1
-    return ok
+
+class Report:
+    """Failure count and buffered output for a validation run.
+
+    Lines for the file being validated are collected and written out in one
+    go by end_file().
+    """
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.output: list[str] = []
+
+    def check(self, label: str, ok: bool, detail: str = "") -> bool:
+        if ok:
+            self.output.append(f"  \u2713 {label}\n")
+        else:
+            msg = f"  \u2717 {label}"
+            if detail:
+                msg += f" — {detail}"
+            self.output.append(msg + "\n")
+            self.failures += 1
+        return ok
+
+    def begin_file(self, name: str) -> None:
+        self.output.append(f"\n{'='*60}\n{name}\n{'='*60}\n")
+
+    def end_file(self, n_rows: int) -> None:
+        self.output.append(f"  — {n_rows} rows\n")
+        sys.stdout.write("".join(self.output))
+        self.output.clear()
+
+
+report = Report()
+check = report.check
+begin_file = report.begin_file
+end_file = report.end_file
 
 
 def read_raw_bytes(path: Path) -> bytes:
     return path.read_bytes()
 
 
+def parse_once(
+    raw: bytes, intern_cols: tuple[int, ...] = ()
+) -> tuple[list[str], list[list[str]], list[int]]:
+    """Decode and parse a CSV file in one pass.
+
+    Returns (header, columns, empty_lines). Rows are transposed into one list
+    per column, in header order, so each check walks only the columns it
+    needs; short rows are padded with empty strings. Blank lines are skipped,
+    as csv.DictReader would, so the columns hold only real records. The line
+    numbers of blank lines and of rows whose fields are all empty are returned
+    for check_no_empty_rows(). Values in ``intern_cols`` (the short code
+    columns) are interned so that repeated codes share one string object and
+    compare by identity.
+    """
+    reader = csv.reader(io.StringIO(raw.decode("utf-8")))
+    header = next(reader)
+    rows = list(reader)
+    empty_lines = []
+    if not all(map(any, rows)):
+        empty_lines = [i for i, row in enumerate(rows, 2) if not any(row)]
+        rows = [row for row in rows if row]
+    cols = [list(col) for col in zip_longest(*rows, fillvalue="")]
+    n = len(cols[0]) if cols else 0
+    cols.extend([""] * n for _ in range(len(header) - len(cols)))
+    for i in intern_cols:
+        cols[i] = list(map(sys.intern, cols[i]))
+    return header, cols, empty_lines
+
+
+# Raw bytes plus the parsed header, columns and empty-line numbers of one CSV file.
+LoadedCSV = tuple[bytes, list[str], list[list[str]], list[int]]
+
+
+def load_csv(raw: bytes, intern_cols: tuple[int, ...] = ()) -> LoadedCSV:
+    header, cols, empty_lines = parse_once(raw, intern_cols)
+    return raw, header, cols, empty_lines
+
+
+# ---------------------------------------------------------------------------
+# Cache of the last passing run
+# ---------------------------------------------------------------------------
+
+
+def file_digests(raws: list[bytes]) -> dict[str, str]:
+    """SHA-256 of each data file, plus this script, keyed by file name."""
+    digests = {
+        path.name: hashlib.sha256(raw).hexdigest()
+        for path, raw in zip(DATA_FILES, raws)
+    }
+    digests[SCRIPT_FILE.name] = hashlib.sha256(SCRIPT_FILE.read_bytes()).hexdigest()
+    return digests
+
+
+def read_cache() -> Optional[dict]:
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(digests: dict[str, str]) -> None:
+    try:
+        CACHE_FILE.write_text(json.dumps(digests, indent=2) + "\n", encoding="utf-8")
+    except OSError:
+        pass  # The cache is only an optimisation.
+
+
 def check_utf8_no_bom(path: Path, raw: bytes) -> bool:
     return check(
         "UTF-8, no BOM",
@@ -72,28 +190,30 @@ def check_utf8_no_bom(path: Path, raw: bytes) -> bool:
 
 
 def check_lf_line_endings(path: Path, raw: bytes) -> bool:
-    has_crlf = b"\r\n" in raw
-    has_cr = b"\r" in raw.replace(b"\r\n", b"")
+    # Any CR byte means CRLF or bare-CR line endings; no need to tell them apart.
     return check(
         "LF line endings",
-        not has_crlf and not has_cr,
+        b"\r" not in raw,
         "found CR or CRLF line endings",
     )
 
 
-def check_correct_header(path: Path, expected: list[str]) -> bool:
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        header = next(reader)
+def check_correct_header(header: list[str], expected: list[str]) -> bool:
     return check("Correct header", header == expected, f"got {header}")
 
 
 def check_no_trailing_commas(path: Path, raw: bytes) -> bool:
-    text = raw.decode("utf-8")
+    # Scan the raw bytes directly; only the first few offending lines are reported.
     bad_lines = []
-    for i, line in enumerate(text.split("\n"), 1):
-        if line.endswith(","):
-            bad_lines.append(i)
+    line, last = 1, 0
+    pos = raw.find(b",\n")
+    while pos != -1 and len(bad_lines) < 5:
+        line += raw.count(b"\n", last, pos)
+        last = pos
+        bad_lines.append(line)
+        pos = raw.find(b",\n", pos + 2)
+    if len(bad_lines) < 5 and raw.endswith(b","):
+        bad_lines.append(line + raw.count(b"\n", last))
     return check(
         "No trailing commas",
         len(bad_lines) == 0,
@@ -101,25 +221,27 @@ def check_no_trailing_commas(path: Path, raw: bytes) -> bool:
     )
 
 
-def check_no_empty_rows(path: Path) -> bool:
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        next(reader)  # skip header
-        empty = [i for i, row in enumerate(reader, 2) if all(c == "" for c in row)]
-    return check("No empty rows", len(empty) == 0, f"empty rows at lines: {empty[:5]}")
-
-
-def load_csv(path: Path) -> list[dict]:
-    with open(path, "r", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+def check_no_empty_rows(empty_lines: list[int]) -> bool:
+    return check(
+        "No empty rows",
+        len(empty_lines) == 0,
+        f"empty rows at lines: {empty_lines[:5]}",
+    )
 
 
-def check_code_format(rows: list[dict], col: str, length: int) -> bool:
-    bad = []
-    for i, row in enumerate(rows, 2):
-        val = row[col]
-        if not (len(val) == length and val.isdigit()):
-            bad.append(f"line {i}: {val!r}")
+def check_code_format(vals: list[str], col: str, length: int) -> bool:
+    # Fast path in C over the whole column; only walk it value by value to
+    # report line numbers. isascii() because isdigit() alone also accepts
+    # non-ASCII digits such as "²".
+    joined = "".join(vals)
+    if joined.isascii() and joined.isdigit() and set(map(len, vals)) == {length}:
+        bad = []
+    else:
+        bad = [
+            f"line {i}: {val!r}"
+            for i, val in enumerate(vals, 2)
+            if not (len(val) == length and val.isascii() and val.isdigit())
+        ]
     return check(
         f"{col} format ({length}-digit zero-padded)",
         len(bad) == 0,
@@ -127,11 +249,14 @@ def check_code_format(rows: list[dict], col: str, length: int) -> bool:
     )
 
 
-def check_no_duplicates(rows: list[dict], col: str) -> bool:
+def check_no_duplicates(vals: list[str], col: str) -> bool:
+    if len(set(vals)) == len(vals):
+        return check(f"No duplicate {col}", True)
+
+    # Only locate line numbers once a duplicate is known to exist.
     seen = {}
     dupes = []
-    for i, row in enumerate(rows, 2):
-        val = row[col]
+    for i, val in enumerate(vals, 2):
         if val in seen:
             dupes.append(f"{val} (lines {seen[val]} and {i})")
         else:
@@ -143,33 +268,37 @@ def check_no_duplicates(rows: list[dict], col: str) -> bool:
     )
 
 
-def check_row_count(rows: list[dict], expected: int) -> bool:
+def check_row_count(n: int, expected: int) -> bool:
     return check(
         f"Row count = {expected}",
-        len(rows) == expected,
-        f"got {len(rows)}",
+        n == expected,
+        f"got {n}",
     )
 
 
-def check_fk(
-    rows: list[dict], col: str, ref_set: set, ref_name: str
-) -> bool:
-    missing = set()
-    for row in rows:
-        if row[col] not in ref_set:
-            missing.add(row[col])
+def check_fk(vals: list[str], col: str, ref_lookup: dict, ref_name: str) -> bool:
+    missing = []
+    unknown = set(vals).difference(ref_lookup)
+    if unknown:
+        # Report missing values in first-seen order.
+        missing = [val for val in dict.fromkeys(vals) if val in unknown]
     return check(
         f"FK {col} → {ref_name}",
         len(missing) == 0,
-        f"missing: {sorted(missing)[:10]}",
+        f"missing: {missing[:10]}",
     )
 
 
-def check_municipality_county_prefix(rows: list[dict]) -> bool:
-    bad = []
-    for i, row in enumerate(rows, 2):
-        if row["municipality_code"][:2] != row["county_code"]:
-            bad.append(f"line {i}: {row['municipality_code']} vs {row['county_code']}")
+def check_municipality_county_prefix(mcs: list[str], ccs: list[str]) -> bool:
+    # Same as mc[:2] == cc for well-formed codes, without allocating slices.
+    if set(map(len, ccs)) <= {2} and all(map(str.startswith, mcs, ccs)):
+        bad = []
+    else:
+        bad = [
+            f"line {i}: {mc} vs {cc}"
+            for i, (mc, cc) in enumerate(zip(mcs, ccs), 2)
+            if len(cc) != 2 or not mc.startswith(cc)
+        ]
     return check(
         "municipality_code[:2] == county_code",
         len(bad) == 0,
@@ -182,190 +311,204 @@ def check_municipality_county_prefix(rows: list[dict]) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def validate_counties():
-    print(f"\n{'='*60}")
-    print(f"counties.csv")
-    print(f"{'='*60}")
+def validate_counties(loaded: LoadedCSV):
+    begin_file("counties.csv")
 
-    raw = read_raw_bytes(COUNTIES_FILE)
+    raw, header, cols, empty_lines = loaded
     check_utf8_no_bom(COUNTIES_FILE, raw)
     check_lf_line_endings(COUNTIES_FILE, raw)
-    check_correct_header(COUNTIES_FILE, COUNTIES_HEADER)
+    check_correct_header(header, COUNTIES_HEADER)
     check_no_trailing_commas(COUNTIES_FILE, raw)
-    check_no_empty_rows(COUNTIES_FILE)
+    check_no_empty_rows(empty_lines)
 
-    rows = load_csv(COUNTIES_FILE)
-    check_code_format(rows, "county_code", 2)
-    check_no_duplicates(rows, "county_code")
-    check_row_count(rows, 21)
+    codes = cols[COUNTY_CODE_IDX]
+    check_code_format(codes, "county_code", 2)
+    check_no_duplicates(codes, "county_code")
+    check_row_count(len(codes), 21)
 
-    print(f"  — {len(rows)} rows")
-    return rows
+    end_file(len(codes))
+    return cols
 
 
-def validate_municipalities(county_codes: set):
-    print(f"\n{'='*60}")
-    print(f"municipalities.csv")
-    print(f"{'='*60}")
+def validate_municipalities(loaded: LoadedCSV, county_lookup: dict):
+    begin_file("municipalities.csv")
 
-    raw = read_raw_bytes(MUNICIPALITIES_FILE)
+    raw, header, cols, empty_lines = loaded
     check_utf8_no_bom(MUNICIPALITIES_FILE, raw)
     check_lf_line_endings(MUNICIPALITIES_FILE, raw)
-    check_correct_header(MUNICIPALITIES_FILE, MUNICIPALITIES_HEADER)
+    check_correct_header(header, MUNICIPALITIES_HEADER)
     check_no_trailing_commas(MUNICIPALITIES_FILE, raw)
-    check_no_empty_rows(MUNICIPALITIES_FILE)
+    check_no_empty_rows(empty_lines)
 
-    rows = load_csv(MUNICIPALITIES_FILE)
-    check_code_format(rows, "municipality_code", 4)
-    check_code_format(rows, "county_code", 2)
-    check_no_duplicates(rows, "municipality_code")
-    check_row_count(rows, 290)
-    check_fk(rows, "county_code", county_codes, "counties.csv")
-    check_municipality_county_prefix(rows)
+    mcs = cols[MUNI_CODE_IDX]
+    ccs = cols[MUNI_COUNTY_CODE_IDX]
+    check_code_format(mcs, "municipality_code", 4)
+    check_code_format(ccs, "county_code", 2)
+    check_no_duplicates(mcs, "municipality_code")
+    check_row_count(len(mcs), 290)
+    check_fk(ccs, "county_code", county_lookup, "counties.csv")
+    check_municipality_county_prefix(mcs, ccs)
 
-    print(f"  — {len(rows)} rows")
-    return rows
+    end_file(len(mcs))
+    return cols
 
 
 def validate_municipality_county(
-    county_codes: set,
-    county_lookup: dict,
-    municipality_codes: set,
-    municipality_lookup: dict,
+    loaded: LoadedCSV, county_lookup: dict, municipality_lookup: dict
 ):
-    print(f"\n{'='*60}")
-    print(f"municipality_county.csv")
-    print(f"{'='*60}")
+    begin_file("municipality_county.csv")
 
-    raw = read_raw_bytes(MUNICIPALITY_COUNTY_FILE)
+    raw, header, cols, empty_lines = loaded
     check_utf8_no_bom(MUNICIPALITY_COUNTY_FILE, raw)
     check_lf_line_endings(MUNICIPALITY_COUNTY_FILE, raw)
-    check_correct_header(MUNICIPALITY_COUNTY_FILE, MUNICIPALITY_COUNTY_HEADER)
+    check_correct_header(header, MUNICIPALITY_COUNTY_HEADER)
     check_no_trailing_commas(MUNICIPALITY_COUNTY_FILE, raw)
-    check_no_empty_rows(MUNICIPALITY_COUNTY_FILE)
-
-    rows = load_csv(MUNICIPALITY_COUNTY_FILE)
-    check_code_format(rows, "municipality_code", 4)
-    check_code_format(rows, "county_code", 2)
-    check_no_duplicates(rows, "municipality_code")
-    check_row_count(rows, 290)
-    check_fk(rows, "county_code", county_codes, "counties.csv")
-    check_fk(rows, "municipality_code", municipality_codes, "municipalities.csv")
-    check_municipality_county_prefix(rows)
-
-    # Join consistency: county_name and county_name_short must match counties.csv
+    check_no_empty_rows(empty_lines)
+
+    mcs = cols[MUNI_CODE_IDX]
+    ccs = cols[MUNI_COUNTY_CODE_IDX]
+    check_code_format(mcs, "municipality_code", 4)
+    check_code_format(ccs, "county_code", 2)
+    check_no_duplicates(mcs, "municipality_code")
+    check_row_count(len(mcs), 290)
+    check_fk(ccs, "county_code", county_lookup, "counties.csv")
+    check_fk(mcs, "municipality_code", municipality_lookup, "municipalities.csv")
+    check_municipality_county_prefix(mcs, ccs)
+
+    # Join consistency: county and municipality columns must match
+    # counties.csv and municipalities.csv respectively.
     join_bad = []
-    for i, row in enumerate(rows, 2):
-        cc = row["county_code"]
-        if cc in county_lookup:
-            ref = county_lookup[cc]
-            if row["county_name"] != ref["county_name"]:
+    muni_bad = []
+    county_get = county_lookup.get
+    municipality_get = municipality_lookup.get
+    for i, (mc, mn, mns, cc, cn, cns) in enumerate(zip(*cols[:6]), 2):
+        ref = county_get(cc)
+        if ref is not None:
+            if cn != ref[COUNTY_NAME_IDX]:
                 join_bad.append(
-                    f"line {i}: county_name {row['county_name']!r} vs {ref['county_name']!r}"
+                    f"line {i}: county_name {cn!r} vs {ref[COUNTY_NAME_IDX]!r}"
                 )
-            if row["county_name_short"] != ref["county_name_short"]:
+            if cns != ref[COUNTY_NAME_SHORT_IDX]:
                 join_bad.append(
-                    f"line {i}: county_name_short {row['county_name_short']!r} vs {ref['county_name_short']!r}"
+                    f"line {i}: county_name_short {cns!r} vs {ref[COUNTY_NAME_SHORT_IDX]!r}"
+                )
+        ref = municipality_get(mc)
+        if ref is not None:
+            if mn != ref[MUNI_NAME_IDX]:
+                muni_bad.append(
+                    f"line {i}: municipality_name {mn!r} vs {ref[MUNI_NAME_IDX]!r}"
+                )
+            if mns != ref[MUNI_NAME_SHORT_IDX]:
+                muni_bad.append(
+                    f"line {i}: municipality_name_short {mns!r} vs {ref[MUNI_NAME_SHORT_IDX]!r}"
                 )
     check(
         "Join consistency (county columns match counties.csv)",
         len(join_bad) == 0,
         f"mismatches: {join_bad[:5]}",
     )
-
-    # Municipality columns must match municipalities.csv
-    muni_bad = []
-    for i, row in enumerate(rows, 2):
-        mc = row["municipality_code"]
-        if mc in municipality_lookup:
-            ref = municipality_lookup[mc]
-            if row["municipality_name"] != ref["municipality_name"]:
-                muni_bad.append(
-                    f"line {i}: municipality_name {row['municipality_name']!r} vs {ref['municipality_name']!r}"
-                )
-            if row["municipality_name_short"] != ref["municipality_name_short"]:
-                muni_bad.append(
-                    f"line {i}: municipality_name_short {row['municipality_name_short']!r} vs {ref['municipality_name_short']!r}"
-                )
     check(
         "Join consistency (municipality columns match municipalities.csv)",
         len(muni_bad) == 0,
         f"mismatches: {muni_bad[:5]}",
     )
 
-    print(f"  — {len(rows)} rows")
-    return rows
+    end_file(len(mcs))
+    return cols
 
 
-def validate_postal(municipality_codes: set, municipality_lookup: dict):
-    print(f"\n{'='*60}")
-    print(f"postal_to_municipality.csv")
-    print(f"{'='*60}")
+def validate_postal(loaded: LoadedCSV, municipality_lookup: dict):
+    begin_file("postal_to_municipality.csv")
 
-    raw = read_raw_bytes(POSTAL_FILE)
+    raw, header, cols, empty_lines = loaded
     check_utf8_no_bom(POSTAL_FILE, raw)
     check_lf_line_endings(POSTAL_FILE, raw)
-    check_correct_header(POSTAL_FILE, POSTAL_HEADER)
+    check_correct_header(header, POSTAL_HEADER)
     check_no_trailing_commas(POSTAL_FILE, raw)
-    check_no_empty_rows(POSTAL_FILE)
-
-    rows = load_csv(POSTAL_FILE)
-    check_code_format(rows, "postal_code", 5)
-    check_code_format(rows, "municipality_code", 4)
-    check_no_duplicates(rows, "postal_code")
-    check_fk(rows, "municipality_code", municipality_codes, "municipalities.csv")
-
-    # municipality_name must match municipalities.csv
+    check_no_empty_rows(empty_lines)
+
+    pcs = cols[POSTAL_CODE_IDX]
+    mcs = cols[POSTAL_MUNI_CODE_IDX]
+    check_code_format(pcs, "postal_code", 5)
+    check_code_format(mcs, "municipality_code", 4)
+    check_no_duplicates(pcs, "postal_code")
+    check_fk(mcs, "municipality_code", municipality_lookup, "municipalities.csv")
+
+    # municipality_name must match municipalities.csv. Resolve each code's
+    # expected name once, then map it over the column; codes missing from
+    # municipalities.csv default to the row's own name (the FK check covers them).
+    names = cols[POSTAL_MUNI_NAME_IDX]
+    expected_names = {mc: ref[MUNI_NAME_IDX] for mc, ref in municipality_lookup.items()}
+    expected = list(map(expected_names.get, mcs, names))
     name_bad = []
-    for i, row in enumerate(rows, 2):
-        mc = row["municipality_code"]
-        if mc in municipality_lookup:
-            expected = municipality_lookup[mc]["municipality_name"]
-            if row["municipality_name"] != expected:
-                name_bad.append(
-                    f"line {i}: {row['municipality_name']!r} vs {expected!r}"
-                )
+    if expected != names:
+        name_bad = [
+            f"line {i}: {name!r} vs {exp!r}"
+            for i, (name, exp) in enumerate(zip(names, expected), 2)
+            if name != exp
+        ]
     check(
         "municipality_name matches municipalities.csv",
         len(name_bad) == 0,
         f"mismatches: {name_bad[:5]}",
     )
 
-    print(f"  — {len(rows)} rows")
-    return rows
+    end_file(len(pcs))
+    return cols
 
 
 def main():
-    global failures
+    use_cache = "--no-cache" not in sys.argv[1:]
 
     print("Swedish Geodata — CSV Validation")
     print("=" * 60)
 
+    raws = [read_raw_bytes(path) for path in DATA_FILES]
+
+    # FK and join checks span files, so the cache only applies when every
+    # file (and this script) is unchanged since the last passing run.
+    if use_cache:
+        digests = file_digests(raws)
+        if read_cache() == digests:
+            print(f"\n{'='*60}")
+            print("No changes since the last passing run (cached \u2713).")
+            print("All checks passed.")
+            sys.exit(0)
+
+    counties_raw, munis_raw, muni_county_raw, postal_raw = raws
+
     # Validate counties
-    county_rows = validate_counties()
-    county_codes = {r["county_code"] for r in county_rows}
-    county_lookup = {r["county_code"]: r for r in county_rows}
+    county_cols = validate_counties(load_csv(counties_raw, (COUNTY_CODE_IDX,)))
+    county_lookup = dict(zip(county_cols[COUNTY_CODE_IDX], zip(*county_cols)))
 
     # Validate municipalities
-    muni_rows = validate_municipalities(county_codes)
-    municipality_codes = {r["municipality_code"] for r in muni_rows}
-    municipality_lookup = {r["municipality_code"]: r for r in muni_rows}
+    muni_cols = validate_municipalities(
+        load_csv(munis_raw, (MUNI_CODE_IDX, MUNI_COUNTY_CODE_IDX)), county_lookup
+    )
+    municipality_lookup = dict(zip(muni_cols[MUNI_CODE_IDX], zip(*muni_cols)))
 
     # Validate municipality_county join
     validate_municipality_county(
-        county_codes, county_lookup, municipality_codes, municipality_lookup
+        load_csv(muni_county_raw, (MUNI_CODE_IDX, MUNI_COUNTY_CODE_IDX)),
+        county_lookup,
+        municipality_lookup,
     )
 
     # Validate postal codes
-    validate_postal(municipality_codes, municipality_lookup)
+    validate_postal(
+        load_csv(postal_raw, (POSTAL_CODE_IDX, POSTAL_MUNI_CODE_IDX)),
+        municipality_lookup,
+    )
 
     # Summary
     print(f"\n{'='*60}")
-    if failures == 0:
+    if report.failures == 0:
+        if use_cache:
+            write_cache(digests)
         print("All checks passed.")
         sys.exit(0)
     else:
-        print(f"{failures} check(s) FAILED.")
+        print(f"{report.failures} check(s) FAILED.")
         sys.exit(1)
 
 